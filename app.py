@@ -1,15 +1,26 @@
 import sys
+from functools import lru_cache
+from math import comb
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QFileDialog, QGraphicsScene, QGraphicsPixmapItem
+    QApplication, QMainWindow, QFileDialog, QGraphicsScene, QGraphicsView, QGraphicsPixmapItem,
+    QGraphicsItem, QGraphicsPathItem, QGraphicsLineItem,
+    QGraphicsItemGroup, QOpenGLWidget
 )
-from PyQt5.QtGui import QPixmap, QPainter, QPen, QColor, QTransform, QCursor, QImage
-from PyQt5.QtCore import Qt, QPointF, QRectF
+from PyQt5.QtGui import (
+    QPixmap, QPainter, QPainterPath, QPen, QColor, QImage, QPolygonF, QOpenGLContext
+)
+from PyQt5.QtCore import Qt, QLineF, QTimer, QThread, pyqtSignal
 from PyQt5 import uic
 import numpy as np
-from scipy.interpolate import splprep, splev
-from sklearn.linear_model import LinearRegression
 from readimc import MCDFile
 
+# splprep needs more points than the (cubic) spline degree
+MIN_SPLINE_POINTS = 4
+
+# Shared "no spline" result, so an empty boundary keeps a stable identity
+NO_SPLINE = np.empty((0, 2), dtype=np.float64)
+NO_SPLINE.setflags(write=False)
+
 
 def to_8bit(array):
     """
@@ -28,23 +39,208 @@ def to_8bit(array):
     if array.ndim != 2:
         raise ValueError("Input array must be two-dimensional (m x n).")
     
-    # Normalize the array values to range 0-1
-    normalized = (array - np.min(array)) / (np.max(array) - np.min(array))
-    
-    # Scale to 0-255 and convert to uint8
-    array_8bit = (normalized * 255).astype(np.uint8)
+    minimum = array.min()
+    value_range = array.max() - minimum
+    array_8bit = np.zeros(array.shape, dtype=np.uint8)
+    if value_range == 0:
+        # A constant image has nothing to stretch
+        return array_8bit
+
+    # Normalize to 0-1 before scaling, in this order, so the maximum lands on
+    # exactly 255 and is not truncated to 254 by float32 rounding
+    scaled = (array - minimum) / value_range
+    scaled *= 255
+    np.copyto(array_8bit, scaled, casting='unsafe')
     
     return array_8bit
 
 # auxiliary functions
-def ndarray_to_qpixmap(array):
-    # Ensure the array is in 8-bit format (dtype=uint8)
+def ndarray_to_qpixmap(array, gamma=1.0):
+    # Write the pixels into a Qt-owned image in the native opaque format, so
+    # QPixmap.fromImage neither converts them nor keeps pointing at NumPy
+    # memory that may be freed once this function returns
     height, width = array.shape
-    bytes_per_line = width
-    qimage = QImage(array.data, width, height, bytes_per_line, QImage.Format_Grayscale8)
+    qimage = QImage(width, height, QImage.Format_RGB32)
+    bits = qimage.bits()
+    bits.setsize(qimage.byteCount())
+    pixels = np.frombuffer(bits, dtype=np.uint32).reshape(height, width)
+    np.take(rgb32_lut(gamma), array, out=pixels, mode='clip')
     return QPixmap.fromImage(qimage)
 
 
+@lru_cache(maxsize=32)
+def gamma_lut(gamma):
+    """Return a read-only 256-entry uint8 lookup table for the given gamma."""
+    lut = np.clip(255 * (np.arange(256) / 255) ** gamma, 0, 255).astype(np.uint8)
+    lut.setflags(write=False)
+    return lut
+
+
+@lru_cache(maxsize=32)
+def rgb32_lut(gamma):
+    """Return a read-only table mapping 8-bit gray levels to RGB32 pixels."""
+    gray = gamma_lut(gamma).astype(np.uint32)
+    lut = 0xFF000000 | (gray << 16) | (gray << 8) | gray
+    lut.setflags(write=False)
+    return lut
+
+
+def bezier_horner(control, t):
+    """
+    Evaluate a Bezier curve with the Horner form of its Bernstein polynomial.
+
+    Parameters:
+        control (ndarray): Control points of shape (n + 1, 2).
+        t (ndarray): Curve parameters in [0, 1].
+
+    Returns:
+        ndarray: Curve points of shape (len(t), 2).
+    """
+    n = len(control) - 1
+    weighted = np.array([comb(n, k) for k in range(n + 1)])[:, None] * control
+    t = np.asarray(t, dtype=np.float64)
+    curve = np.empty((len(t), 2))
+
+    # Horner runs in s = t / (1 - t), which blows up towards t = 1, so the
+    # second half is evaluated on the reversed curve instead
+    first_half = t <= 0.5
+    for mask, h, tt in ((first_half, weighted, t), (~first_half, weighted[::-1], 1 - t)):
+        ts = tt[mask][:, None]
+        s = ts / (1 - ts)
+        acc = np.broadcast_to(h[n], (len(ts), 2))
+        for k in range(n - 1, -1, -1):
+            acc = acc * s + h[k]
+        curve[mask] = acc * (1 - ts) ** n
+    return curve
+
+
+def sample_adaptive(curve, tolerance=0.5, initial_samples=32, max_samples=4096):
+    """
+    Sample a parametric curve on [0, 1] densely only where it bends.
+
+    Segments are bisected until the curve point halfway along each one lies
+    within tolerance pixels of the middle of its chord.
+
+    Parameters:
+        curve (callable): Maps an array of parameters to (len(t), 2) points.
+        tolerance (float): Maximum allowed deviation in pixels.
+        initial_samples (int): Number of evenly spaced starting samples.
+        max_samples (int): Upper bound on the number of returned samples.
+
+    Returns:
+        ndarray: Curve points of shape (N, 2), ordered along the curve.
+    """
+    t = np.linspace(0, 1, num=initial_samples)
+    points = curve(t)
+    while len(t) < max_samples:
+        t_mid = (t[:-1] + t[1:]) / 2
+        mid = curve(t_mid)
+        deviation = np.hypot(*(mid - (points[:-1] + points[1:]) / 2).T)
+        split = np.flatnonzero(deviation > tolerance)
+        if split.size == 0:
+            break
+        split = split[:max_samples - len(t)]
+        t = np.insert(t, split + 1, t_mid[split])
+        points = np.insert(points, split + 1, mid[split], axis=0)
+    return points
+
+
+def slope_from_sums(n, sx, sy, sxx, sxy):
+    """
+    Least-squares slope of y on x from the sums of x, y, x*x and x*y.
+
+    Points stacked vertically have no x spread; they get a zero slope.
+    """
+    denominator = n * sxx - sx * sx
+    if denominator <= 1e-12 * n * sxx:
+        return 0.0
+    return (n * sxy - sx * sy) / denominator
+
+
+def point_sums(points):
+    """Regression sums [n, x, y, x*x, x*y] of an (N, 2) point array."""
+    x = points[:, 0]
+    y = points[:, 1]
+    return np.array([len(points), x.sum(), y.sum(), (x * x).sum(), (x * y).sum()])
+
+
+def fit_curve(points):
+    """
+    Fit a smooth curve through an (N, 2) array of points.
+
+    Returns:
+        callable: Maps parameters in [0, 1] to (len(t), 2) curve points, or
+        None if no curve could be fitted.
+    """
+    if len(points) < MIN_SPLINE_POINTS:
+        # Too few points for a cubic spline, draw a Bezier curve instead
+        control = points.copy()
+        if len(control) == 3:
+            # Move the middle control point so the curve passes through it
+            control[1] = 2 * control[1] - (control[0] + control[2]) / 2
+        return lambda u: bezier_horner(control, u)
+
+    # scipy is only needed once a boundary has enough points, keep it off
+    # the start-up path
+    from scipy.interpolate import splprep, splev
+
+    try:
+        tck, _ = splprep([points[:, 0], points[:, 1]], s=0)
+    except Exception as e:
+        print(f"Spline creation error: {e}")
+        return None
+    return lambda u: np.column_stack(splev(u, tck))
+
+
+def opengl_available():
+    """Return True if an OpenGL context can be created on this display."""
+    return QOpenGLContext().create()
+
+
+def array_to_qpolygonf(xy):
+    """Build a QPolygonF from an (N, 2) float64 array of x/y coordinates."""
+    n = len(xy)
+    polygon = QPolygonF(n)
+    if n:
+        # QPolygonF stores its points as contiguous (x, y) doubles, so the
+        # coordinates can be copied straight into its buffer in one go
+        buffer = polygon.data()
+        buffer.setsize(n * 2 * 8)
+        np.frombuffer(buffer, dtype=np.float64).reshape(n, 2)[:] = xy
+    return polygon
+
+
+class AntialiasedPathItem(QGraphicsPathItem):
+    """Path item that antialiases its own stroke; the view does not."""
+
+    def paint(self, painter, option, widget=None):
+        painter.setRenderHint(QPainter.Antialiasing)
+        super().paint(painter, option, widget)
+
+
+class AcquisitionLoader(QThread):
+    """Read the first acquisition of an MCD file in a background thread."""
+    loaded = pyqtSignal(object, object, object, object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, file_name, parent=None):
+        super().__init__(parent)
+        self.file_name = file_name
+
+    def run(self):
+        try:
+            with MCDFile(self.file_name) as f:
+                # first acquisition of first slide
+                slide = f.slides[0]
+                acquisition = slide.acquisitions[0]
+                img = f.read_acquisition(acquisition)
+            # QPixmaps may only be created on the GUI thread, so only the
+            # 8-bit conversion of the first channel is done here
+            self.loaded.emit(slide, acquisition, img, to_8bit(img[0, :, :]))
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
 class BezierSplineTool(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -54,6 +250,12 @@ class BezierSplineTool(QMainWindow):
         # Initialize scene
         self.scene = QGraphicsScene()
         self.graphicsView.setScene(self.scene)
+        self.graphicsView.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
+        # Composite the scene on the GPU instead of the raster engine, but
+        # keep the raster viewport where no GL context can be created (remote
+        # X, VMs), as a GL viewport would then render nothing
+        if opengl_available():
+            self.graphicsView.setViewport(QOpenGLWidget())
         
         # Connect signals
         self.load_button.clicked.connect(self.load_image)
@@ -66,69 +268,157 @@ class BezierSplineTool(QMainWindow):
         self.button_delete_boundary.clicked.connect(self.delete_boundary)
         self.slider_gamma.valueChanged.connect(self.update_gamma)
 
+        # Gamma changes are applied at most once per frame while the slider moves
+        self.pending_gamma = self.slider_gamma.value() / 100.0
+        self.gamma_timer = QTimer(self)
+        self.gamma_timer.setSingleShot(True)
+        self.gamma_timer.setInterval(16)
+        self.gamma_timer.timeout.connect(self.apply_gamma)
+
+        # Wheel zoom steps are likewise accumulated and applied once per frame
+        self.pending_zoom = 1.0
+        self.zoom_timer = QTimer(self)
+        self.zoom_timer.setSingleShot(True)
+        self.zoom_timer.setInterval(16)
+        self.zoom_timer.timeout.connect(self.apply_zoom)
+
         # Initialize general variables
         self.pixmap_item = None
+        self.loader = None
         self.drawing_enabled = False
         self.base_pixmap = None
         self.zoom_scale = 1.0
-        self.scene_rect = QRectF()
+
+        # Overlay items, kept on top of the image and updated in place
+        self.points_item = QGraphicsItemGroup()
+        self.points_item.setZValue(1)
+        self.scene.addItem(self.points_item)
+        self.point_items = []
+
+        # Point marker, rendered once and shared by every marker item
+        self.dot_pixmap = QPixmap(10, 10)
+        self.dot_pixmap.fill(Qt.transparent)
+        painter = QPainter(self.dot_pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor("yellow"))
+        painter.drawEllipse(0, 0, 10, 10)
+        painter.end()
+
+        pen = QPen(QColor("green"), 2)
+        self.spline_item = AntialiasedPathItem()
+        self.spline_item.setPen(pen)
+        self.spline_item.setZValue(2)
+        self.scene.addItem(self.spline_item)
+        self.drawn_spline = None
+
+        self.shifted_spline_item = AntialiasedPathItem()
+        self.shifted_spline_item.setPen(pen)
+        self.shifted_spline_item.setZValue(2)
+        self.scene.addItem(self.shifted_spline_item)
+        self.drawn_shifted_spline = None
+
+        # An ROI has at most three straight edges
+        self.roi_line_items = []
+        for _ in range(3):
+            item = QGraphicsLineItem()
+            item.setPen(pen)
+            item.setZValue(2)
+            item.hide()
+            self.scene.addItem(item)
+            self.roi_line_items.append(item)
 
         # ROI vars
-        self.points = []
+        self.points = np.empty((0, 2), dtype=np.float64)  # (N, 2) x/y in scene coordinates
+        self.regression_sums = np.zeros(5)  # kept in step with self.points, see point_sums()
         self.roi_lines = []
-        self.shifted_points = []
+        self.shifted_points = np.empty((0, 2), dtype=np.float64)
+        self.spline_cache = {}
+        self.curve_cache = {}
 
     def load_image(self):
         file_name, _ = QFileDialog.getOpenFileName(self, "Open MCD File", "", "Images (*.mcd)")
+        if not file_name:
+            return
 
-        with MCDFile(file_name) as f:
-            # first slide
-            slide = f.slides[0]
-            self.width_um = slide.width_um
-            self.height_um = slide.height_um
-            print(
-                slide.id,
-                slide.description,
-                slide.width_um,
-                slide.height_um,
-            )
-            # first acquisition of first slide
-            acquisition = slide.acquisitions[0]
-            self.img = f.read_acquisition(acquisition)
-            self.n_channels, self.height_px, self.width_px = self.img.shape
-            # self.px_per_um = self.width_px/self.width_um
-            # self.pixel_um_input.setText(str(self.px_per_um))
-
-            print(
-                acquisition.id,
-                acquisition.description,
-                acquisition.width_um,
-                acquisition.height_um,
-                acquisition.channel_names,  # metals
-                acquisition.channel_labels,  # targets
-            )
+        # Reading the acquisition can take a while, keep the UI responsive
+        self.load_button.setEnabled(False)
+        self.statusBar().showMessage(f"Loading {file_name}...")
+        self.loader = AcquisitionLoader(file_name, self)
+        self.loader.loaded.connect(self.on_image_loaded)
+        self.loader.failed.connect(self.on_load_failed)
+        self.loader.finished.connect(self.on_load_finished)
+        self.loader.finished.connect(self.loader.deleteLater)
+        self.loader.start()
+
+    def on_load_finished(self):
+        self.load_button.setEnabled(True)
+        self.loader = None
+
+    def closeEvent(self, event):
+        # Reading an acquisition cannot be interrupted, so let a running load
+        # finish rather than destroy its thread with the window
+        if self.loader is not None:
+            self.loader.wait()
+        super().closeEvent(event)
+
+    def on_load_failed(self, message):
+        self.statusBar().showMessage(f"Could not load file: {message}")
+
+    def on_image_loaded(self, slide, acquisition, img, channel_8bit):
+        self.statusBar().clearMessage()
+        self.width_um = slide.width_um
+        self.height_um = slide.height_um
+        print(
+            slide.id,
+            slide.description,
+            slide.width_um,
+            slide.height_um,
+        )
+        self.img = img
+        self.n_channels, self.height_px, self.width_px = self.img.shape
+        self.channels_8bit = [None] * self.n_channels
+        self.channels_8bit[0] = channel_8bit
+        self.current_channel = 0
+        # self.px_per_um = self.width_px/self.width_um
+        # self.pixel_um_input.setText(str(self.px_per_um))
+
+        print(
+            acquisition.id,
+            acquisition.description,
+            acquisition.width_um,
+            acquisition.height_um,
+            acquisition.channel_names,  # metals
+            acquisition.channel_labels,  # targets
+        )
 
         # populate list QtWidgets
+        self.list_channels.clear()
         for channel in acquisition.channel_labels:
             self.list_channels.addItem(channel)
 
-        if file_name:
-            self.pixmap = ndarray_to_qpixmap(to_8bit(self.img[0, :, :]))
-            self.base_pixmap = self.pixmap.copy()
-
-            if self.pixmap_item:
-                self.scene.removeItem(self.pixmap_item)
+        self.pixmap = ndarray_to_qpixmap(self.channel_8bit(0))
+        # Overlays are separate scene items and never paint into the image,
+        # so the displayed pixmap can share the original's data
+        self.base_pixmap = self.pixmap
 
+        if self.pixmap_item:
+            self.pixmap_item.setPixmap(self.base_pixmap)
+        else:
             self.pixmap_item = QGraphicsPixmapItem(self.base_pixmap)
+            self.pixmap_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
             self.scene.addItem(self.pixmap_item)
-            self.scene.setSceneRect(self.pixmap_item.boundingRect())
-            
-            self.graphicsView.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
-            
-            self.points = []
-            self.drawing_enabled = True
-            self.roi_lines = []
-            self.update_display()
+        self.scene.setSceneRect(self.pixmap_item.boundingRect())
+        
+        self.graphicsView.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
+        self.zoom_scale = self.graphicsView.transform().m11()
+        
+        self.points = np.empty((0, 2), dtype=np.float64)
+        self.regression_sums = np.zeros(5)
+        self.clear_spline_cache()
+        self.drawing_enabled = True
+        self.roi_lines = []
+        self.update_display()
 
     def mousePressEvent(self, event):
         if not self.drawing_enabled or not self.base_pixmap:
@@ -138,83 +428,95 @@ class BezierSplineTool(QMainWindow):
             return
 
         if event.button() == Qt.LeftButton:
-            cursor_pos = QCursor.pos()
-            view_pos = self.graphicsView.mapFromGlobal(cursor_pos)
+            view_pos = self.graphicsView.mapFromGlobal(event.globalPos())
             scene_pos = self.graphicsView.mapToScene(view_pos)
             if self.scene.sceneRect().contains(scene_pos):
-                self.points.append(scene_pos)
+                new_point = np.array([[scene_pos.x(), scene_pos.y()]])
+                self.points = np.vstack([self.points, new_point])
+                self.regression_sums += point_sums(new_point)
+                self.clear_spline_cache()
                 self.update_display()
         elif event.button() == Qt.RightButton:
-            cursor_pos = QCursor.pos()
-            view_pos = self.graphicsView.mapFromGlobal(cursor_pos)
+            view_pos = self.graphicsView.mapFromGlobal(event.globalPos())
             scene_pos = self.graphicsView.mapToScene(view_pos)
-            if self.points:
-                self.points = [p for p in self.points if (p - scene_pos).manhattanLength() > 10]
-                self.update_display()
+            if len(self.points):
+                distance = np.abs(self.points - (scene_pos.x(), scene_pos.y())).sum(axis=1)
+                removed = distance <= 10
+                if removed.any():
+                    self.regression_sums -= point_sums(self.points[removed])
+                    self.points = self.points[~removed]
+                    if not len(self.points):
+                        # Drop any rounding left over from the subtractions
+                        self.regression_sums = np.zeros(5)
+                    self.clear_spline_cache()
+                    self.update_display()
 
     def wheelEvent(self, event):
         if self.drawing_enabled and self.base_pixmap:
             zoom_factor = 1.1
-            if event.angleDelta().y() > 0:
-                self.zoom_scale *= zoom_factor
-            else:
-                self.zoom_scale /= zoom_factor
+            if event.angleDelta().y() <= 0:
+                zoom_factor = 1 / zoom_factor
+            # Fast wheel spins are accumulated and applied once per frame
+            self.pending_zoom *= zoom_factor
+            if not self.zoom_timer.isActive():
+                self.zoom_timer.start()
 
-            self.graphicsView.setTransform(QTransform().scale(self.zoom_scale, self.zoom_scale))
+    def apply_zoom(self):
+        self.zoom(self.pending_zoom)
+        self.pending_zoom = 1.0
 
     def update_display(self):
         if not self.base_pixmap:
             return
 
-        if self.pixmap_item:
-            self.scene.removeItem(self.pixmap_item)
-        
-        pixmap = QPixmap(self.base_pixmap)
-        painter = QPainter(pixmap)
+        self.update_point_items()
 
-        # Draw points
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor("yellow"))
-        for point in self.points:
-            painter.drawEllipse(point, 5, 5)
-
-        # Draw spline
-        if len(self.points) >= 2:
-            try:
-                spline_points = self.create_bezier_spline(self.points)
-                pen = QPen(QColor("green"), 2)
-                painter.setPen(pen)
-                path = [spline_points[0]]
-                for point in spline_points[1:]:
-                    painter.drawLine(path[-1], point)
-                    path.append(point)
-            except Exception as e:
-                print(f"Error creating spline: {e}")
-
-        # Draw shifted spline
-        if len(self.shifted_points) >= 2:
-            try:
-                spline_points = self.create_bezier_spline(self.shifted_points)
-                pen = QPen(QColor("green"), 2)
-                painter.setPen(pen)
-                path = [spline_points[0]]
-                for point in spline_points[1:]:
-                    painter.drawLine(path[-1], point)
-                    path.append(point)
-            except Exception as e:
-                print(f"Error creating spline: {e}")
-
-        # Draw ROI lines if they exist
-        if self.roi_lines:
-            pen = QPen(QColor("green"), 2)
-            painter.setPen(pen)
-            for line in self.roi_lines:
-                painter.drawLine(line[0], line[1])
+        # The boundary path is only rebuilt when its sampled spline changes
+        try:
+            spline = self.create_bezier_spline(self.points)
+            if spline is not self.drawn_spline:
+                path = QPainterPath()
+                path.addPolygon(array_to_qpolygonf(spline))
+                self.spline_item.setPath(path)
+                self.drawn_spline = spline
+        except Exception as e:
+            print(f"Error creating spline: {e}")
 
-        painter.end()
+        # Shifted spline, likewise only rebuilt when it changes
+        try:
+            spline = self.create_bezier_spline(self.shifted_points)
+            if spline is not self.drawn_shifted_spline:
+                path = QPainterPath()
+                path.addPolygon(array_to_qpolygonf(spline))
+                self.shifted_spline_item.setPath(path)
+                self.drawn_shifted_spline = spline
+        except Exception as e:
+            print(f"Error creating spline: {e}")
+
+        # ROI lines, unused line items are hidden
+        for i, item in enumerate(self.roi_line_items):
+            if i < len(self.roi_lines):
+                (x1, y1), (x2, y2) = self.roi_lines[i]
+                line = QLineF(x1, y1, x2, y2)
+                if line != item.line():
+                    item.setLine(line)
+                item.show()
+            else:
+                item.hide()
+
+    def update_point_items(self):
+        """Add or remove point markers so that they match self.points."""
+        while len(self.point_items) > len(self.points):
+            self.scene.removeItem(self.point_items.pop())
+
+        while len(self.point_items) < len(self.points):
+            item = QGraphicsPixmapItem(self.dot_pixmap, self.points_item)
+            item.setOffset(-5, -5)
+            self.point_items.append(item)
 
-        self.pixmap_item = QGraphicsPixmapItem(pixmap)
-        self.scene.addItem(self.pixmap_item)
+        for item, (x, y) in zip(self.point_items, self.points):
+            if item.x() != x or item.y() != y:
+                item.setPos(x, y)
 
     def create_roi(self):
 
@@ -229,31 +531,26 @@ class BezierSplineTool(QMainWindow):
         
         depth_pixels = depth_um * pixel_um
 
-        # Linear Regression
-        x = np.array([p.x() for p in self.points]).reshape(-1, 1)
-        y = np.array([p.y() for p in self.points])
-        model = LinearRegression()
-        model.fit(x, y)
-        slope = model.coef_[0]
+        # Linear Regression from the running sums
+        slope = slope_from_sums(*self.regression_sums)
     
         # Calculate Unit Normal
-        normal_x = -slope
-        normal_y = 1
-        norm = np.sqrt(normal_x**2 + normal_y**2)
-        unit_normal = QPointF(normal_x / norm, normal_y / norm)
+        normal = np.array([-slope, 1.0])
+        unit_normal = normal / np.hypot(*normal)
+        shift = unit_normal * depth_pixels
 
         # linear style for the bottom
         if self.radio_linear.isChecked():
 
             self.roi_lines = []
-            self.shifted_points = []
+            self.shifted_points = np.empty((0, 2), dtype=np.float64)
 
             # Shift First and Last Points
             first_point = self.points[0]
             last_point = self.points[-1]
             
-            shifted_first_point = first_point + (unit_normal * depth_pixels)
-            shifted_last_point = last_point + (unit_normal * depth_pixels)
+            shifted_first_point = first_point + shift
+            shifted_last_point = last_point + shift
             
             # Create the line segments for the ROI
             self.roi_lines = [
@@ -264,10 +561,7 @@ class BezierSplineTool(QMainWindow):
 
         else:
             self.roi_lines = []
-            self.shifted_points = []
-            self.shifted_points = np.copy(self.points)
-            for i, point in enumerate(self.points):
-                self.shifted_points[i] = point + unit_normal * depth_pixels
+            self.shifted_points = self.points + shift
 
             self.roi_lines = [(self.points[0], self.shifted_points[0]),
                               (self.points[-1], self.shifted_points[-1])]
@@ -281,78 +575,103 @@ class BezierSplineTool(QMainWindow):
         if self.pixmap_item:
             self.graphicsView.setSceneRect(self.pixmap_item.boundingRect())
             self.graphicsView.fitInView(self.pixmap_item.boundingRect(), Qt.KeepAspectRatio)
-            self.zoom_scale = 1.0
-            self.graphicsView.setTransform(QTransform().scale(self.zoom_scale, self.zoom_scale))
+            self.zoom_scale = self.graphicsView.transform().m11()
+            self.update_display()
 
     def clear_area(self):
         self.roi_lines = []
-        self.points = []
-        self.shifted_points = []
+        self.points = np.empty((0, 2), dtype=np.float64)
+        self.regression_sums = np.zeros(5)
+        self.shifted_points = np.empty((0, 2), dtype=np.float64)
+        self.clear_spline_cache()
 
     def delete_boundary(self):
         self.clear_area()
         self.update_display()
 
+    def zoom(self, factor):
+        """Scale the view by factor relative to its current transform."""
+        self.zoom_scale *= factor
+        self.graphicsView.scale(factor, factor)
+        self.update_display()
+
     def zoom_in(self):
-        self.zoom_scale *= 1.125
-        self.graphicsView.setTransform(QTransform().scale(self.zoom_scale, self.zoom_scale))
+        self.zoom(1.125)
 
     def zoom_out(self):
-        self.zoom_scale *= 0.875
-        self.graphicsView.setTransform(QTransform().scale(self.zoom_scale, self.zoom_scale))
+        self.zoom(0.875)
+
+    def clear_spline_cache(self):
+        self.spline_cache.clear()
+        self.curve_cache.clear()
 
     def create_bezier_spline(self, points):
         if len(points) < 2:
-            return []
-
-        x = [p.x() for p in points]
-        y = [p.y() for p in points]
-
-        try:
-            tck, _ = splprep([x, y], s=0)
-            u = np.linspace(0, 1, num=500)
-            spline_x, spline_y = splev(u, tck)
-            return [QPointF(px, py) for px, py in zip(spline_x, spline_y)]
-        except Exception as e:
-            print(f"Spline creation error: {e}")
-            return [QPointF(px, py) for px, py in zip(x, y)]
+            return NO_SPLINE
+
+        # Samples only need to be accurate to about half a screen pixel, so
+        # the tolerance follows the zoom in steps of powers of two
+        zoom_level = round(np.log2(self.zoom_scale))
+        tolerance = 0.5 / 2 ** zoom_level
+
+        # The same boundary is redrawn on every zoom, gamma change and ROI
+        # update, so reuse the sampled spline until its points or the zoom
+        # level change
+        points_key = points.tobytes()
+        key = (points_key, zoom_level)
+        spline = self.spline_cache.get(key)
+        if spline is not None:
+            return spline
+
+        # The fitted curve is cached on its own so that resampling it at a
+        # new zoom level does not need another splprep
+        if points_key not in self.curve_cache:
+            self.curve_cache[points_key] = fit_curve(points)
+        curve = self.curve_cache[points_key]
+
+        spline = sample_adaptive(curve, tolerance) if curve else points.copy()
+        spline.setflags(write=False)
+        self.spline_cache[key] = spline
+        return spline
 
     def update_gamma(self, value):
-        """Update the gamma of the pixmap based on the slider value."""
-        gamma = value / 100.0  # Assuming slider value is scaled for gamma adjustment
-        self.base_pixmap = self.adjust_gamma(self.pixmap, gamma)
-        self.redraw_graphics()
-
-    def adjust_gamma(self, pixmap, gamma):
-        """Adjust the gamma of the given QPixmap."""
-        image = pixmap.toImage()
-        width, height = image.width(), image.height()
+        """Schedule a gamma update; rapid slider moves are coalesced into one per frame."""
+        self.pending_gamma = value / 100.0  # Assuming slider value is scaled for gamma adjustment
+        if not self.gamma_timer.isActive():
+            self.gamma_timer.start()
 
-        # Convert QImage to NumPy array
-        buffer = image.bits().asstring(image.byteCount())
-        arr = np.frombuffer(buffer, dtype=np.uint8).reshape((height, width, 4))  # RGBA
-
-        # Apply gamma correction
-        gamma_corrected = np.clip(255 * (arr / 255) ** gamma, 0, 255).astype(np.uint8)
+    def apply_gamma(self):
+        """Update the gamma of the pixmap based on the last slider value."""
+        if not self.base_pixmap:
+            return
+        channel = self.channel_8bit(self.current_channel)
+        self.base_pixmap = self.adjust_gamma(channel, self.pending_gamma)
+        self.redraw_graphics()
 
-        # Convert back to QImage
-        corrected_image = QImage(gamma_corrected.data, width, height, image.bytesPerLine(), QImage.Format_RGBA8888)
-        return QPixmap.fromImage(corrected_image)
+    def adjust_gamma(self, array, gamma):
+        """Return a QPixmap of the 8-bit grayscale array with gamma applied."""
+        return ndarray_to_qpixmap(array, gamma)
 
     def redraw_graphics(self):
         """Redraw the graphics view with the updated pixmap."""
         self.pixmap_item.setPixmap(self.base_pixmap)
-        self.scene.update()
 
     def display_channel(self):
         selected_items = self.list_channels.selectedItems()
         indices = [self.list_channels.row(item) for item in selected_items]
         if indices != []:
             ix = indices[0]
-            self.pixmap = ndarray_to_qpixmap(to_8bit(self.img[ix, :, :]))
-            self.base_pixmap = self.pixmap.copy()
+            self.current_channel = ix
+            self.pixmap = ndarray_to_qpixmap(self.channel_8bit(ix))
+            self.base_pixmap = self.pixmap
             self.redraw_graphics()
 
+    def channel_8bit(self, ix):
+        """Return the 8-bit version of channel ix, converting it on first use."""
+        if self.channels_8bit[ix] is None:
+            self.channels_8bit[ix] = to_8bit(self.img[ix, :, :])
+        return self.channels_8bit[ix]
+
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)